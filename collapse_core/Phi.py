@@ -3,6 +3,8 @@ from .types import SemanticGraph, CandidateSet, SurvivorSet
 
 class Phi:
     """Nilpotent eliminator: permanently removes non-survivors and logs reasons."""
+    WRITES = ("cursor.plan_step",)  # G paths apply() may mutate
+
     def __init__(self):
         self.ledger: List[dict] = []
 
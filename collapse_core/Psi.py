@@ -11,9 +11,12 @@ class Psi:
     def score(self, G: dict, tok: str) -> float:
         return float(PSI_PREF.get(tok, 0.0))
 
+    def rank(self, G: dict, V: SurvivorSet) -> List[str]:
+        scored = [(tok, self.score(G, tok)) for tok in V.tokens]
+        scored.sort(key=lambda p: (-p[1], p[0]))
+        return [tok for tok, _ in scored]
+
     def select(self, G: dict, V: SurvivorSet) -> Tuple[str, str]:
         if len(V.tokens) == 1:
             return V.tokens[0], "unique"
-        scored = [(tok, self.score(G, tok)) for tok in V.tokens]
-        scored.sort(key=lambda p: (-p[1], p[0]))
-        return scored[0][0], "ranker"
+        return self.rank(G, V)[0], "ranker"
@@ -1,6 +1,41 @@
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Set
 from .types import SemanticGraph, CandidateSet, SurvivorSet
 
+def reads(*paths, by_step: Optional[Dict[int, tuple]] = None):
+    """
+    Declares which G fields a kernel reads, as dotted paths ("discourse.time").
+    `by_step` narrows the declaration per step index; steps not listed read `paths`.
+    Kernels without a declaration are assumed to read all of G.
+    """
+    def wrap(k):
+        k.reads = frozenset(paths)
+        k.reads_by_step = {i: frozenset(p) for i, p in (by_step or {}).items()}
+        return k
+    return wrap
+
+def kernel_reads(k, step_idx: int) -> Optional[Set[str]]:
+    """G paths kernel `k` reads at `step_idx`, or None if undeclared."""
+    if not hasattr(k, "reads"):
+        return None
+    return set(k.reads_by_step.get(step_idx, k.reads))
+
+def batched(prefetch):
+    """
+    Attaches prefetch(step_idx, tokens, G) to a kernel. T.prune calls it once per step
+    with the whole candidate set before the per-token loop, so lookups can be batched.
+    """
+    def wrap(k):
+        k.prefetch = prefetch
+        return k
+    return wrap
+
+def prefetch_all(kernels, step_idx: int, tokens: List[str], G: dict):
+    for k in kernels:
+        pf = getattr(k, "prefetch", None)
+        if pf is not None:
+            pf(step_idx, tokens, G)
+
+@reads()
 def k_grammar_expected(step_idx: int, tok: str, G: dict):
     expect = {
         0: {"cat": "Subject"},
@@ -33,6 +68,7 @@ def k_grammar_expected(step_idx: int, tok: str, G: dict):
     cat = expect[step_idx]["cat"]
     return (tok in sets[cat], f"grammar:{cat}")
 
+@reads(by_step={0: ("plans",), 2: ("plans",), 5: ("discourse.last_person_male",)})
 def k_role_semantics(step_idx: int, tok: str, G: dict):
     # Step 0: subject must be agent
     if step_idx == 0:
@@ -69,6 +105,7 @@ def k_role_semantics(step_idx: int, tok: str, G: dict):
         return (tok == "approved", "role:predicate_approved")
     return (True, "role:any")
 
+@reads("discourse.time")
 def k_tense(step_idx: int, tok: str, G: dict):
     if G["discourse"]["time"] != "past":
         return (True, "tense:na")
@@ -86,9 +123,20 @@ class T:
     def candidates(self, G: dict, candidates: list) -> CandidateSet:
         return CandidateSet(candidates)
 
+    def reads(self, step_idx: int) -> Optional[Set[str]]:
+        """Union of the kernels' read sets at `step_idx`; None if any kernel is undeclared."""
+        out: Set[str] = set()
+        for k in self.kernels:
+            r = kernel_reads(k, step_idx)
+            if r is None:
+                return None
+            out |= r
+        return out
+
     def prune(self, step_idx: int, G: dict, C: CandidateSet) -> Tuple[SurvivorSet, Dict[str, list]]:
         survivors = []
         elim_reasons: Dict[str, list] = {}
+        prefetch_all(self.kernels, step_idx, C.tokens, G)
         for tok in C.tokens:
             ok_all = True
             reasons_failed = []
@@ -0,0 +1,194 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ARTIFACT_FILES = ("trace.csv", "trace.chain", "phi_ledger.csv")
+RESULT_FILE = "result.json"
+
+
+def _module_source(obj) -> Optional[str]:
+    """Source of the module defining obj (conservative: any edit there invalidates)."""
+    try:
+        return inspect.getsource(inspect.getmodule(obj) or obj)
+    except (OSError, TypeError):
+        code = getattr(obj, "__code__", None)
+        if code is None:
+            return None
+        return repr((code.co_code, code.co_consts, code.co_names))
+
+
+def code_version(engine) -> Optional[str]:
+    """
+    Fingerprint of the kernel, Φ, Ψ and engine code: the source of every collapse_core
+    module plus the modules defining the engine, T, Φ, Ψ and each kernel. Other modules
+    those import are NOT hashed. None if any source is unavailable.
+    """
+    parts = []
+    seen = set()
+    package = sorted(Path(__file__).parent.glob("*.py"))
+    for path in package:
+        parts.append(path.read_text(encoding="utf-8"))
+        seen.add(f"{__package__}.{path.stem}")
+    for obj in [type(engine), type(engine.T), type(engine.Phi), type(engine.Psi), *engine.T.kernels]:
+        mod = inspect.getmodule(obj)
+        ident = mod.__name__ if mod is not None else id(obj)
+        if ident in seen:
+            continue
+        seen.add(ident)
+        src = _module_source(obj)
+        if src is None:
+            return None
+        parts.append(src)
+    kernel_names = [getattr(k, "__qualname__", repr(k)) for k in engine.T.kernels]
+    return hashlib.sha256("\0".join(parts + kernel_names).encode("utf-8")).hexdigest()
+
+
+def _cell_contents(cell):
+    try:
+        return cell.cell_contents
+    except ValueError:  # empty cell
+        return None
+
+
+def runtime_state(engine) -> dict:
+    """
+    Instance attributes of T (besides its kernels), Φ and Ψ, and the closure variables
+    of every kernel: state that changes results without changing any source.
+    """
+    return {
+        "T": {k: v for k, v in vars(engine.T).items() if k != "kernels"},
+        "Phi": vars(engine.Phi),
+        "Psi": vars(engine.Psi),
+        "closures": [[_cell_contents(c) for c in (getattr(k, "__closure__", None) or ())]
+                     for k in engine.T.kernels],
+    }
+
+
+def snapshot_paths(G: dict, paths) -> Dict[str, object]:
+    """Values of the dotted G paths that exist (the state a run may have written)."""
+    out = {}
+    for path in paths:
+        node = G
+        for part in path.split("."):
+            if not isinstance(node, dict) or part not in node:
+                break
+            node = node[part]
+        else:
+            out[path] = node
+    return out
+
+
+def restore_paths(G: dict, snapshot: Dict[str, object]):
+    for path, value in snapshot.items():
+        *parents, leaf = path.split(".")
+        node = G
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+
+
+class ArtifactCache:
+    """
+    Content-addressed store of finished runs: one directory per key holding the
+    scenario artifacts plus result.json. Bounded to `max_bytes`; least recently
+    used entries (by result.json mtime, refreshed on every hit) are evicted first.
+
+    The key covers G, the candidates, the run options, code_version() and
+    runtime_state(). Values that are not JSON are keyed by repr(): for plain objects
+    that embeds the memory address, so such runs only hit within one process. Code
+    in helper modules outside collapse_core that kernels import is not part of the
+    key; after editing one, clear the cache or run without it.
+    """
+    def __init__(self, root=".collapse_cache", max_bytes: int = 256 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def default(cls) -> "ArtifactCache":
+        root = os.environ.get("COLLAPSE_CACHE_DIR", ".collapse_cache")
+        max_mb = int(os.environ.get("COLLAPSE_CACHE_MAX_MB", "256"))
+        return cls(root, max_bytes=max_mb * 1024 * 1024)
+
+    def key(self, engine, G: dict, candidates_per_step: List[List[str]], options: Optional[dict] = None) -> Optional[str]:
+        version = code_version(engine)
+        if version is None:
+            return None
+        inputs = json.dumps([G, candidates_per_step, runtime_state(engine), options or {}],
+                            sort_keys=True, ensure_ascii=False, default=repr)
+        return hashlib.sha256(f"{version}\0{inputs}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self.root / key
+        result = entry / RESULT_FILE
+        if not result.exists():
+            return None
+        try:
+            data = json.loads(result.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        os.utime(result)  # LRU: mark as recently used
+        data["entry"] = entry
+        return data
+
+    def restore(self, hit: dict, artifacts_dir: Path):
+        """
+        Copies cached artifacts into artifacts_dir, skipping files that already match.
+        Every copy lands under a temp name first and they are swapped in together, so
+        a failed restore never mixes files from two runs.
+        """
+        suffix = f".tmp-{uuid.uuid4().hex}"
+        staged = []
+        try:
+            for name in ARTIFACT_FILES:
+                src, dst = hit["entry"] / name, artifacts_dir / name
+                if dst.exists() and dst.read_bytes() == src.read_bytes():
+                    continue
+                tmp = artifacts_dir / f"{name}{suffix}"
+                shutil.copyfile(src, tmp)
+                staged.append((tmp, dst))
+            for tmp, dst in staged:
+                os.replace(tmp, dst)
+        finally:
+            for tmp, _ in staged:
+                if tmp.exists():
+                    tmp.unlink()
+
+    def put(self, key: str, artifacts_dir: Path, result: dict):
+        entry = self.root / key
+        if entry.exists():
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir()
+        for name in ARTIFACT_FILES:
+            shutil.copyfile(artifacts_dir / name, tmp / name)
+        (tmp / RESULT_FILE).write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        try:
+            os.replace(tmp, entry)
+        except OSError:  # another run stored the same key first
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self.evict(keep=key)
+
+    def evict(self, keep: Optional[str] = None):
+        entries = []
+        total = 0
+        for entry in self.root.iterdir():
+            if entry.name.startswith(".") or not (entry / RESULT_FILE).exists():
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append(((entry / RESULT_FILE).stat().st_mtime, entry, size))
+            total += size
+        entries.sort(key=lambda e: e[0])
+        for _, entry, size in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
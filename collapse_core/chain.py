@@ -0,0 +1,89 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+GENESIS = "0" * 64
+# One fixed-width record per step:
+#   "<sha256 hex> <trace.csv byte offset> <phi_ledger.csv byte offset>\n"
+# The ledger offset is where that step's Φ rows start (or would start, if it has none).
+RECORD_SIZE = 64 + 1 + 16 + 1 + 16 + 1
+
+
+def step_digest(prev: str, candidates: List[str], survivors: List[str], eliminated: List[dict], choice: str) -> str:
+    """Rolling hash: digest of the previous link plus this step's (C, V, Φ eliminations, Ψ choice)."""
+    payload = json.dumps([prev, candidates, survivors, eliminated, choice],
+                         ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class HashChain:
+    """Extends the chain one step at a time, writing each record to `out` (binary) as it goes."""
+    def __init__(self, out):
+        self.out = out
+        self.head = GENESIS
+        self.steps = 0
+
+    def update(self, raw: dict, trace_offset: int = 0, ledger_offset: int = 0) -> str:
+        self.head = step_digest(self.head, raw["candidates"], raw["survivors_after_T"],
+                                raw["eliminated"], raw["psi_choice"])
+        self.out.write(f"{self.head} {trace_offset:016d} {ledger_offset:016d}\n".encode("ascii"))
+        self.steps += 1
+        return self.head
+
+
+class ChainFile:
+    """Random access to a written chain; each lookup reads a single record."""
+    def __init__(self, path):
+        path = Path(path)
+        if path.is_dir():
+            path = path / "trace.chain"
+        self.path = path
+        self._f = open(path, "rb")
+        self._f.seek(0, 2)
+        self._len = self._f.tell() // RECORD_SIZE
+
+    def __len__(self) -> int:
+        return self._len
+
+    def record(self, i: int) -> Tuple[str, int, int]:
+        """Returns (digest, trace.csv offset, phi_ledger.csv offset) for 0-based step index i."""
+        self._f.seek(i * RECORD_SIZE)
+        digest, trace_offset, ledger_offset = self._f.read(RECORD_SIZE).decode("ascii").split()
+        return digest, int(trace_offset), int(ledger_offset)
+
+    def digest(self, i: int) -> str:
+        return self.record(i)[0]
+
+    def head(self) -> str:
+        return self.digest(self._len - 1) if self._len else GENESIS
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def first_divergence(a: ChainFile, b: ChainFile) -> Optional[int]:
+    """
+    0-based index of the first step whose links differ, or None if the runs are identical.
+    Links commit to their whole prefix, so equality is monotone and binary search applies:
+    O(log n) record reads, O(1) when the heads already match.
+    """
+    n = min(len(a), len(b))
+    if len(a) == len(b) and a.head() == b.head():
+        return None
+    if n and a.digest(n - 1) == b.digest(n - 1):
+        return n  # one run is a strict prefix of the other
+    lo, hi = 0, n - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if a.digest(mid) == b.digest(mid):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
@@ -1,19 +1,38 @@
-from typing import List, Dict
-from .types import CandidateSet
+from typing import List, Dict, Set
+from .types import CandidateSet, SurvivorSet, InfeasibleSequence
 from .T import T
 from .Phi import Phi
 from .Psi import Psi
 
 class CollapseEngine:
+    WRITES = ("discourse.last_person_male",)  # G paths step() mutates besides Φ's
+
     def __init__(self, T_op: T, Phi_op: Phi, Psi_op: Psi):
         self.T = T_op; self.Phi = Phi_op; self.Psi = Psi_op
+        self.lookahead = None  # optional Lookahead steering Ψ's choice
+
+    def writes(self) -> Set[str]:
+        """Every G path a step may mutate (Φ.apply plus the discourse update)."""
+        return set(self.WRITES) | set(self.Phi.WRITES)
 
     def step(self, step_idx: int, G: dict, candidates: List[str]) -> Dict:
         C = self.T.candidates(G, candidates)
         V, elim_reasons = self.T.prune(step_idx, G, C)  # T
+        return self.commit(step_idx, G, C, V, elim_reasons)
+
+    def commit(self, step_idx: int, G: dict, C: CandidateSet, V: SurvivorSet, elim_reasons: Dict[str, list]) -> Dict:
+        """Φ -> Ψ -> state update for an already-pruned step."""
         G = self.Phi.apply(step_idx, G, C, V, elim_reasons)  # Φ
-        tok, mode = self.Psi.select(G, V)  # Ψ
+        if not V.tokens:
+            raise InfeasibleSequence(step_idx + 1, elim_reasons)
+        if self.lookahead is not None:
+            tok, mode = self.lookahead.select(step_idx, G, V)  # Ψ, forward-checked
+        else:
+            tok, mode = self.Psi.select(G, V)  # Ψ
+        self.update(G, tok)
+        return {"token": tok, "mode": mode, "survivors": V.tokens, "elim_reasons": elim_reasons}
+
+    def update(self, G: dict, tok: str):
         # Simple discourse update
         if tok == "Bob":
             G["discourse"]["last_person_male"] = "Bob"
-        return {"token": tok, "mode": mode, "survivors": V.tokens, "elim_reasons": elim_reasons}
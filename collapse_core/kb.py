@@ -0,0 +1,213 @@
+import errno
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Triple = Tuple[str, str, str]  # (relation, subject, object)
+
+MMAP_BYTES = 1 << 30
+BATCH = 500  # keeps IN (...) under SQLite's bound-parameter limit
+
+
+def _fact_line(triple: Triple) -> bytes:
+    return "\t".join(triple).encode("utf-8") + b"\n"
+
+
+def fingerprint(triples: Iterable[Triple]) -> str:
+    """Content hash FactStore.build records for the same triple stream."""
+    digest = hashlib.sha256()
+    for triple in triples:
+        digest.update(_fact_line(triple))
+    return digest.hexdigest()
+
+
+class Relation:
+    """Dict-like view of one relation, so kernels can keep using G["facts"][rel].get(subject)."""
+    def __init__(self, store: "FactStore", name: str):
+        self.store = store
+        self.name = name
+
+    def get(self, subject: str, default=None):
+        obj = self.store.get(self.name, subject)
+        return default if obj is None else obj
+
+    def get_many(self, subjects: Iterable[str]) -> Dict[str, Optional[str]]:
+        return self.store.get_many(self.name, subjects)
+
+    def __getitem__(self, subject: str) -> str:
+        obj = self.store.get(self.name, subject)
+        if obj is None:
+            raise KeyError(subject)
+        return obj
+
+    def __contains__(self, subject: str) -> bool:
+        return self.store.get(self.name, subject) is not None
+
+
+class FactStore:
+    """
+    Read-only (relation, subject) -> object index in a local SQLite file, opened with
+    memory-mapped I/O so workers share the OS page cache instead of copying facts.
+    Lookups go through a small LRU (misses are cached too); get_many resolves a whole
+    candidate set with one query per BATCH uncached subjects. Connections are per
+    thread, so the store is safe under PipelinedExecutor. Copies and pickles carry
+    only the path: deepcopy(G) shares the store rather than duplicating it.
+    """
+    def __init__(self, path, cache_size: int = 4096):
+        self.path = Path(path)
+        if not self.path.is_file():
+            raise FileNotFoundError(errno.ENOENT, "no FactStore index", str(self.path))
+        self.cache_size = cache_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._lru: "OrderedDict[Tuple[str, str], Optional[str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        try:
+            row = self._conn().execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        except sqlite3.DatabaseError as e:
+            self.close()
+            raise sqlite3.DatabaseError(f"{self.path}: {e}") from e
+        if row is None:
+            self.close()
+            raise sqlite3.DatabaseError(f"{self.path}: not a FactStore index (no fingerprint)")
+        self.fingerprint = row[0]
+
+    @classmethod
+    def build(cls, path, triples: Iterable[Triple], cache_size: int = 4096) -> "FactStore":
+        """Writes triples (streamed, any order) to a fresh index at path and opens it."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex}")
+        digest = hashlib.sha256()
+        try:
+            conn = sqlite3.connect(tmp)
+            try:
+                conn.execute("CREATE TABLE facts (relation TEXT, subject TEXT, object TEXT, "
+                             "PRIMARY KEY (relation, subject)) WITHOUT ROWID")
+                conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                batch: List[Triple] = []
+                for triple in triples:
+                    digest.update(_fact_line(triple))
+                    batch.append(triple)
+                    if len(batch) >= 10000:
+                        conn.executemany("INSERT OR REPLACE INTO facts VALUES (?, ?, ?)", batch)
+                        batch = []
+                conn.executemany("INSERT OR REPLACE INTO facts VALUES (?, ?, ?)", batch)
+                conn.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (digest.hexdigest(),))
+                conn.commit()
+            finally:
+                conn.close()
+            os.replace(tmp, path)
+        finally:
+            # a failed build (bad triple stream, full disk, ...) leaves no orphan temp file
+            if tmp.exists():
+                tmp.unlink()
+        return cls(path, cache_size=cache_size)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            self._local.conn = conn
+            conn.execute(f"PRAGMA mmap_size = {MMAP_BYTES}")
+        return conn
+
+    def close(self):
+        """Closes this thread's connection (others close when their thread ends)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _remember(self, key: Tuple[str, str], obj: Optional[str]):
+        self._lru[key] = obj
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.cache_size:
+            self._lru.popitem(last=False)
+
+    def get(self, relation: str, subject: str) -> Optional[str]:
+        return self.get_many(relation, [subject])[subject]
+
+    def get_many(self, relation: str, subjects: Iterable[str]) -> Dict[str, Optional[str]]:
+        out: Dict[str, Optional[str]] = {}
+        missing: List[str] = []
+        with self._lock:
+            for s in subjects:
+                key = (relation, s)
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    out[s] = self._lru[key]
+                    self.hits += 1
+                elif s not in out:
+                    out[s] = None
+                    missing.append(s)
+            self.misses += len(missing)
+        found: Dict[str, str] = {}
+        for i in range(0, len(missing), BATCH):
+            chunk = missing[i:i + BATCH]
+            rows = self._conn().execute(
+                f"SELECT subject, object FROM facts WHERE relation = ? AND subject IN ({','.join('?' * len(chunk))})",
+                [relation, *chunk])
+            found.update(rows)
+        with self._lock:
+            for s in missing:
+                out[s] = found.get(s)
+                self._remember((relation, s), out[s])
+        return out
+
+    def __getitem__(self, relation: str) -> Relation:
+        return Relation(self, relation)
+
+    def __repr__(self) -> str:
+        # Stable across processes; the artifact cache keys G on this.
+        return f"FactStore({str(self.path)!r}, fingerprint={self.fingerprint!r})"
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __getstate__(self):
+        return {"path": self.path, "cache_size": self.cache_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], cache_size=state["cache_size"])
+
+
+def read_tsv(path) -> Iterable[Triple]:
+    """
+    Yields (relation, subject, object) per line, skipping blank lines. Lines without
+    exactly three tab-separated fields raise ValueError once the file has been read,
+    so FactStore.build never publishes an index that silently lost facts.
+    """
+    bad: List[int] = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+            parts = line.split("\t")
+            if len(parts) == 3:
+                yield parts[0], parts[1], parts[2]
+            else:
+                bad.append(lineno)
+    if bad:
+        shown = ", ".join(map(str, bad[:10])) + (", ..." if len(bad) > 10 else "")
+        raise ValueError(f"{path}: {len(bad)} malformed line(s), expected "
+                         f"relation<TAB>subject<TAB>object, at line(s) {shown}")
+
+
+if __name__ == "__main__":
+    # python -m collapse_core.kb facts.sqlite triples.tsv   (relation<TAB>subject<TAB>object per line)
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m collapse_core.kb OUT.sqlite TRIPLES.tsv")
+    try:
+        store = FactStore.build(sys.argv[1], read_tsv(sys.argv[2]))
+    except (OSError, ValueError) as e:
+        sys.exit(f"error: {e}")
+    print(f"Built {store!r}")
@@ -0,0 +1,73 @@
+import bisect
+import copy
+from typing import Dict, List, Optional, Tuple
+from .types import CandidateSet, SurvivorSet, InfeasibleSequence
+from .T import kernel_reads, prefetch_all
+from .pipeline import depends_on
+
+
+class Lookahead:
+    """
+    Forward checking over a known candidate sequence.
+
+    check() evaluates, for every step, the kernels whose declared reads are disjoint
+    from what any step can write. Their verdicts cannot change during the run, so a
+    step they leave empty makes the whole sequence infeasible; it is rejected before
+    any step executes. Dynamic kernels are skipped there (assumed to pass).
+
+    select() replaces Ψ's choice when |V| > 1 and a later step reads written state:
+    it walks Ψ's ranking and takes the first token whose state update still leaves the
+    next such (dependent) step with a survivor, assuming no writes in between. When the
+    dependent step comes right after the choice that is exact and, if no token passes,
+    the run is rejected. Further ahead, intermediate steps may still write the state it
+    needs, so the check only steers; if no token passes, Ψ's own choice is kept.
+    """
+    def __init__(self, engine, candidates_per_step: List[List[str]]):
+        self.engine = engine
+        self.candidates = candidates_per_step
+        self.writes = engine.writes()
+        self.dependent = [j for j in range(len(candidates_per_step)) if not self.independent(j)]
+
+    def next_dependent(self, step_idx: int) -> Optional[int]:
+        """First step after step_idx whose kernels read state a step can write."""
+        i = bisect.bisect_right(self.dependent, step_idx)
+        return self.dependent[i] if i < len(self.dependent) else None
+
+    def independent(self, step_idx: int) -> bool:
+        return not depends_on(self.engine.T.reads(step_idx), self.writes)
+
+    def static_prune(self, step_idx: int, G: dict) -> Tuple[List[str], Dict[str, list]]:
+        static = [k for k in self.engine.T.kernels
+                  if not depends_on(kernel_reads(k, step_idx), self.writes)]
+        survivors, elim_reasons = [], {}
+        prefetch_all(static, step_idx, self.candidates[step_idx], G)
+        for tok in self.candidates[step_idx]:
+            failed = [tag for ok, tag in (k(step_idx, tok, G) for k in static) if not ok]
+            if failed:
+                elim_reasons[tok] = failed
+            else:
+                survivors.append(tok)
+        return survivors, elim_reasons
+
+    def check(self, G: dict):
+        """Raises InfeasibleSequence for the first step the static kernels leave empty."""
+        for step_idx in range(len(self.candidates)):
+            survivors, elim_reasons = self.static_prune(step_idx, G)
+            if not survivors:
+                raise InfeasibleSequence(step_idx + 1, elim_reasons)
+
+    def select(self, step_idx: int, G: dict, V: SurvivorSet) -> Tuple[str, str]:
+        nxt = self.next_dependent(step_idx)
+        if len(V.tokens) == 1 or nxt is None:
+            return self.engine.Psi.select(G, V)
+        ranked = self.engine.Psi.rank(G, V)
+        elim_reasons: Dict[str, list] = {}
+        for tok in ranked:
+            G_next = copy.deepcopy(G)
+            self.engine.update(G_next, tok)
+            V_next, elim_reasons = self.engine.T.prune(nxt, G_next, CandidateSet(self.candidates[nxt]))
+            if V_next.tokens:
+                return tok, ("ranker" if tok == ranked[0] else "lookahead")
+        if nxt == step_idx + 1:
+            raise InfeasibleSequence(nxt + 1, elim_reasons)
+        return self.engine.Psi.select(G, V)
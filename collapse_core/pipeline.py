@@ -0,0 +1,71 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from .engine import CollapseEngine
+
+
+def paths_overlap(a: str, b: str) -> bool:
+    """True if dotted G paths a and b name the same field or one contains the other."""
+    return a == b or a.startswith(b + ".") or b.startswith(a + ".")
+
+
+def depends_on(read_set: Optional[Set[str]], write_set: Set[str]) -> bool:
+    if read_set is None:
+        return True  # undeclared kernel: assume it reads everything
+    return any(paths_overlap(r, w) for r in read_set for w in write_set)
+
+
+class PipelinedExecutor:
+    """
+    Runs engine steps with T.prune overlapped across steps.
+
+    A step whose kernels' read set is disjoint from everything Φ.apply and
+    CollapseEngine.step can write sees the same G no matter how many earlier steps
+    have committed, so its prune is submitted to a worker pool up to `window` steps
+    ahead. Steps that read a written field are pruned inline, after every earlier
+    step has committed. Φ, Ψ and the state update always run in step order, so the
+    outputs are identical to calling engine.step sequentially.
+
+    Workers are threads, so this only pays off for kernels that release the GIL while
+    they wait: I/O-bound lookups such as FactStore (SQLite) or remote services.
+    Pure-Python CPU-bound kernels gain nothing and pay the pool overhead. A process
+    pool is not used because scenario kernels are closures, which do not pickle.
+    """
+    def __init__(self, engine: CollapseEngine, max_workers: Optional[int] = None, window: int = 64):
+        self.engine = engine
+        self.max_workers = max_workers
+        self.window = max(1, window)
+
+    def independent(self, step_idx: int, write_set: Set[str]) -> bool:
+        return not depends_on(self.engine.T.reads(step_idx), write_set)
+
+    def _prune(self, step_idx: int, G: dict, cand: List[str]):
+        C = self.engine.T.candidates(G, cand)
+        V, elim_reasons = self.engine.T.prune(step_idx, G, C)
+        return C, V, elim_reasons
+
+    def run(self, G: dict, candidates_per_step: Iterable[List[str]]) -> Iterator[Tuple[int, List[str], dict]]:
+        """Yields (step_idx, candidates, engine output) in step order."""
+        write_set = self.engine.writes()
+        steps = enumerate(candidates_per_step)
+        pending = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            def fill():
+                while len(pending) < self.window:
+                    nxt = next(steps, None)
+                    if nxt is None:
+                        return
+                    step_idx, cand = nxt
+                    fut = None
+                    if self.independent(step_idx, write_set):
+                        fut = pool.submit(self._prune, step_idx, G, cand)
+                    pending.append((step_idx, cand, fut))
+
+            fill()
+            while pending:
+                step_idx, cand, fut = pending.popleft()
+                C, V, elim_reasons = fut.result() if fut is not None else self._prune(step_idx, G, cand)
+                out = self.engine.commit(step_idx, G, C, V, elim_reasons)
+                yield step_idx, cand, out
+                fill()
@@ -15,3 +15,12 @@ class CandidateSet:
 
 class SurvivorSet(CandidateSet):
     pass
+
+
+class InfeasibleSequence(Exception):
+    """Raised when a step (1-based) is left with no survivors."""
+    def __init__(self, step: int, reasons: Dict[str, list]):
+        self.step = step
+        self.reasons = reasons
+        detail = "; ".join(f"{tok}: {','.join(r)}" for tok, r in reasons.items())
+        super().__init__(f"no survivors at step {step} ({detail})")
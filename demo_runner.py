@@ -8,20 +8,38 @@ Self-contained scenarios; supports:
   --color
   --json
   --verify
+  --stream [--steps A:B] [--token TOK] [--page-size N]
+  --render-artifacts PATH
+  --compare DIR_A DIR_B [--context N]
+  --pipelined
+  --cache
+  --lookahead
 """
 
 import argparse
+import csv
+import errno
+import io
 import json
+import os
+import sqlite3
 import sys
+import uuid
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import pandas as pd
 
+from collapse_core.cache import ArtifactCache, restore_paths, snapshot_paths
+from collapse_core.chain import ChainFile, HashChain, first_divergence
 from collapse_core.engine import CollapseEngine
-from collapse_core.T import T
+from collapse_core.kb import FactStore, fingerprint as kb_fingerprint
+from collapse_core.lookahead import Lookahead
+from collapse_core.pipeline import PipelinedExecutor
+from collapse_core.T import T, batched, reads
 from collapse_core.Phi import Phi
 from collapse_core.Psi import Psi
+from collapse_core.types import InfeasibleSequence
 
 # Optional pretty printing
 try:
@@ -69,10 +87,10 @@ def candidates_basic() -> List[List[str]]:
         [".","!"]
     ]
 
-def run_basic():
+def run_basic(**run_kwargs):
     G = build_basic_graph()
     engine = CollapseEngine(T(), Phi(), Psi())
-    return run_sequence(engine, G, candidates_basic(), artifacts_subdir="basic")
+    return run_sequence(engine, G, candidates_basic(), artifacts_subdir="basic", **run_kwargs)
 
 
 # =============== Scenario: COREF (tightened) ===============
@@ -97,6 +115,7 @@ def candidates_coref() -> List[List[str]]:
     ]
 
 def kernels_coref():
+    @reads()
     def k_grammar(step, tok, G):
         cats = {
             0: {"She","He","They"},
@@ -107,21 +126,25 @@ def kernels_coref():
         }
         return (tok in cats[step], f"grammar:step{step}")
 
+    @reads()
     def k_coref(step, tok, G):
         if step == 0:
             return (tok == "She", "coref:female_she")
         return (True, "coref:any")
 
+    @reads("discourse.time")
     def k_tense(step, tok, G):
         if G["discourse"].get("time") == "past" and tok in {"presents"}:
             return (False, "tense:must_be_past")
         return (True, "tense:ok")
 
+    @reads()
     def k_definiteness(step, tok, G):
         if step == 2:
             return (tok == "the", "role:definite_results")
         return (True, "role:any")
 
+    @reads()
     def k_content(step, tok, G):
         if step == 3:
             return (tok == "results", "role:present_results")
@@ -129,10 +152,10 @@ def kernels_coref():
 
     return [k_grammar, k_coref, k_tense, k_definiteness, k_content]
 
-def run_coref():
+def run_coref(**run_kwargs):
     G = build_coref_graph()
     engine = CollapseEngine(T(kernels=kernels_coref()), Phi(), Psi())
-    return run_sequence(engine, G, candidates_coref(), artifacts_subdir="coref")
+    return run_sequence(engine, G, candidates_coref(), artifacts_subdir="coref", **run_kwargs)
 
 
 # =============== Scenario: TENSE (consistency; definite object) ===============
@@ -156,6 +179,7 @@ def candidates_tense() -> List[List[str]]:
     ]
 
 def kernels_tense():
+    @reads()
     def k_grammar(step, tok, G):
         cats = {
             0: {"the"},
@@ -169,17 +193,20 @@ def kernels_tense():
         }
         return (tok in cats[step], f"grammar:step{step}")
 
+    @reads("discourse.time")
     def k_tense(step, tok, G):
         if G["discourse"].get("time") == "past":
             if tok in {"completes","complete","celebrates"}:
                 return (False, "tense:must_be_past")
         return (True, "tense:ok")
 
+    @reads()
     def k_roles(step, tok, G):
         if step == 4:
             return (tok == "project", "role:singular_object")
         return (True, "role:any")
 
+    @reads()
     def k_definiteness(step, tok, G):
         if step == 3:
             return (tok == "the", "role:definite_object")
@@ -187,22 +214,44 @@ def kernels_tense():
 
     return [k_grammar, k_tense, k_roles, k_definiteness]
 
-def run_tense():
+def run_tense(**run_kwargs):
     G = build_tense_graph()
     engine = CollapseEngine(T(kernels=kernels_tense()), Phi(), Psi())
-    return run_sequence(engine, G, candidates_tense(), artifacts_subdir="tense")
+    return run_sequence(engine, G, candidates_tense(), artifacts_subdir="tense", **run_kwargs)
 
 
 # =============== Scenario: KB (domain facts) ===============
+KB_FACTS = [
+    ("capital_of", "France", "Paris"),
+    ("capital_of", "Germany", "Berlin"),
+    ("capital_of", "Spain", "Madrid"),
+]
+
+def open_kb() -> FactStore:
+    """
+    Opens the fact index named by COLLAPSE_KB_PATH if set (FileNotFoundError if no
+    such file exists; it is never built implicitly); otherwise the demo index at
+    artifacts/kb/facts.sqlite, (re)built from KB_FACTS when missing, stale,
+    unreadable or not a FactStore index.
+    """
+    env_path = os.environ.get("COLLAPSE_KB_PATH")
+    if env_path:
+        if not Path(env_path).is_file():
+            raise FileNotFoundError(errno.ENOENT, "COLLAPSE_KB_PATH names no file", env_path)
+        return FactStore(env_path)
+    path = Path("artifacts") / "kb" / "facts.sqlite"
+    if path.exists():
+        try:
+            store = FactStore(path)
+        except sqlite3.DatabaseError:
+            store = None
+        if store is not None and store.fingerprint == kb_fingerprint(KB_FACTS):
+            return store
+    return FactStore.build(path, KB_FACTS)
+
 def build_kb_graph():
     return {
-        "facts": {
-            "capital_of": {
-                "France": "Paris",
-                "Germany": "Berlin",
-                "Spain": "Madrid"
-            }
-        },
+        "facts": open_kb(),
         "subject_city": "Paris",
         "discourse": {"time": "present"},
         "cursor": {"state": "s0"}
@@ -215,10 +264,17 @@ def candidates_kb() -> List[List[str]]:
     ]
 
 def kernels_kb():
+    @reads()
     def k_grammar(step, tok, G):
         cats = {0: {"France","Germany","Spain"}, 1: {"."}}
         return (tok in cats[step], f"grammar:step{step}")
 
+    def prefetch_capitals(step, toks, G):
+        if step == 0:
+            G["facts"]["capital_of"].get_many(toks)
+
+    @batched(prefetch_capitals)
+    @reads("facts.capital_of", "subject_city")
     def k_fact(step, tok, G):
         if step == 0:
             capitals = G["facts"]["capital_of"]
@@ -228,26 +284,43 @@ def kernels_kb():
 
     return [k_grammar, k_fact]
 
-def run_kb():
+def run_kb(**run_kwargs):
     G = build_kb_graph()
     engine = CollapseEngine(T(kernels=kernels_kb()), Phi(), Psi())
-    return run_sequence(engine, G, candidates_kb(), artifacts_subdir="kb")
+    return run_sequence(engine, G, candidates_kb(), artifacts_subdir="kb", **run_kwargs)
 
 
 # =============== Shared runner & printers ===============
-def run_sequence(engine: CollapseEngine, G: dict, candidates_per_step: List[List[str]], artifacts_subdir: str):
+def _sequential(engine: CollapseEngine, G: dict, candidates_per_step: Iterable[List[str]]):
+    for step_idx, cand in enumerate(candidates_per_step):
+        yield step_idx, cand, engine.step(step_idx, G, cand)  # T -> Φ -> Ψ
+
+
+def iter_steps(engine: CollapseEngine, G: dict, candidates_per_step: Iterable[List[str]],
+               pipelined: bool = False, lookahead: bool = False) -> Iterator[dict]:
     """
-    Runs the collapse loop and returns:
-      emitted (list[str]),
-      trace_df (pd.DataFrame),
-      phi_df (pd.DataFrame),
-      steps_raw (list[dict]),  # raw per-step data for JSON
-      candidates_copy (List[List[str]])  # echo back for verification
+    Runs the collapse loop lazily, yielding one raw step dict (JSON shape) per step.
+    pipelined=True overlaps T.prune of independent steps (see collapse_core.pipeline);
+    the yielded steps are identical either way.
+    lookahead=True rejects statically infeasible sequences before the first step and
+    steers Ψ away from choices that leave the next step empty (see collapse_core.lookahead).
     """
-    trace_rows, emitted, steps_raw = [], [], []
-    for step_idx, cand in enumerate(candidates_per_step):
-        out = engine.step(step_idx, G, cand)  # T -> Φ -> Ψ
-        emitted.append(out["token"])
+    if lookahead:
+        candidates_per_step = list(candidates_per_step)
+        engine.lookahead = Lookahead(engine, candidates_per_step)
+        engine.lookahead.check(G)
+    try:
+        yield from _raw_steps(engine, G, candidates_per_step, pipelined)
+    finally:
+        engine.lookahead = None
+
+
+def _raw_steps(engine: CollapseEngine, G: dict, candidates_per_step: Iterable[List[str]], pipelined: bool):
+    if pipelined:
+        outputs = PipelinedExecutor(engine).run(G, candidates_per_step)
+    else:
+        outputs = _sequential(engine, G, candidates_per_step)
+    for step_idx, cand, out in outputs:
 
         survivors = out["survivors"]
         eliminated = [t for t in cand if t not in survivors]
@@ -256,16 +329,7 @@ def run_sequence(engine: CollapseEngine, G: dict, candidates_per_step: List[List
             for t in eliminated
         ]
 
-        trace_rows.append({
-            "Step": step_idx + 1,
-            "Candidates": ", ".join(cand),
-            "Survivors_after_T": ", ".join(survivors),
-            "Ψ_choice": out["token"],
-            "Ψ_mode": out["mode"],
-            "Entropy_H": 0.0
-        })
-
-        steps_raw.append({
+        yield {
             "step": step_idx + 1,
             "candidates": cand,
             "survivors_after_T": survivors,
@@ -273,19 +337,173 @@ def run_sequence(engine: CollapseEngine, G: dict, candidates_per_step: List[List
             "psi_choice": out["token"],
             "psi_mode": out["mode"],
             "entropy_H": 0.0
-        })
+        }
+
+
+TRACE_COLUMNS = ["Step", "Candidates", "Survivors_after_T", "Ψ_choice", "Ψ_mode", "Entropy_H"]
+PHI_COLUMNS = ["Step", "Eliminated_Token", "Reasons"]
+
 
+def _csv_line(values) -> bytes:
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerow(values)
+    return buf.getvalue().encode("utf-8")
+
+
+def trace_row(raw: dict) -> dict:
+    """Flattens a raw step dict into a trace.csv row."""
+    return {
+        "Step": raw["step"],
+        "Candidates": ", ".join(raw["candidates"]),
+        "Survivors_after_T": ", ".join(raw["survivors_after_T"]),
+        "Ψ_choice": raw["psi_choice"],
+        "Ψ_mode": raw["psi_mode"],
+        "Entropy_H": raw["entropy_H"]
+    }
+
+
+def run_sequence(engine: CollapseEngine, G: dict, candidates_per_step: List[List[str]], artifacts_subdir: str,
+                 on_step: Optional[Callable[[dict], None]] = None, pipelined: bool = False,
+                 cache: bool = False, lookahead: bool = False, collect: bool = True):
+    """
+    Runs the collapse loop and returns:
+      emitted (list[str]),
+      trace_df (pd.DataFrame),
+      phi_df (pd.DataFrame),
+      steps_raw (list[dict]),  # raw per-step data for JSON
+      candidates_copy (List[List[str]])  # echo back for verification
+    on_step, if given, is called with each raw step as soon as it is produced
+    (used by the streaming renderer). pipelined selects the PipelinedExecutor;
+    lookahead enables forward checking (raises InfeasibleSequence for dead ends).
+    Alongside trace.csv and phi_ledger.csv, writes trace.chain: a rolling hash per step
+    (see collapse_core.chain) plus the byte offsets of that step's rows in both files,
+    for fast run-to-run comparison and seeking.
+    cache=True looks results up by a content hash of (G, candidates, lookahead, kernel/Φ/Ψ
+    code and instance/closure state); on a hit nothing is recomputed. pipelined is not
+    part of the key: its outputs are identical, so it shares entries with sequential runs. COLLAPSE_NO_CACHE=1 overrides it. Helper modules outside
+    collapse_core are not hashed (see ArtifactCache), which is why caching is opt-in.
+    All three files are streamed row by row. With collect=False the only per-step
+    state kept in memory is the emitted token list: each step's Φ ledger rows are
+    written and then cleared from engine.Phi.ledger (left empty afterwards), and
+    trace_df, phi_df, steps_raw and candidates_copy come back as None. pipelined
+    runs additionally hold up to `window` pruned steps in flight. Such runs are
+    never cached.
+    """
     # Artifacts (per-scenario subdir)
     artifacts_dir = Path("artifacts") / artifacts_subdir
     artifacts_dir.mkdir(parents=True, exist_ok=True)
-    trace_df = pd.DataFrame(trace_rows)
-    phi_df = pd.DataFrame(engine.Phi.ledger)
-    trace_df.to_csv(artifacts_dir / "trace.csv", index=False)
-    phi_df.to_csv(artifacts_dir / "phi_ledger.csv", index=False)
+
+    store = ArtifactCache.default() if cache and collect and not os.environ.get("COLLAPSE_NO_CACHE") else None
+    key = store.key(engine, G, candidates_per_step, options={"lookahead": lookahead}) if store else None
+    hit = store.get(key) if key else None
+    if hit:
+        store.restore(hit, artifacts_dir)
+        steps_raw = hit["steps_raw"]
+        engine.Phi.ledger = hit["ledger"]
+        restore_paths(G, hit["G"])
+        if on_step is not None:
+            for raw in steps_raw:
+                on_step(raw)
+        trace_df = pd.DataFrame([trace_row(raw) for raw in steps_raw], columns=TRACE_COLUMNS)
+        phi_df = pd.DataFrame(engine.Phi.ledger)
+        emitted = [raw["psi_choice"] for raw in steps_raw]
+        return emitted, trace_df, phi_df, steps_raw, [list(x) for x in candidates_per_step], artifacts_dir
+
+    trace_rows, emitted, steps_raw = [], [], []
+    ledger = engine.Phi.ledger
+    # trace.csv, phi_ledger.csv and trace.chain are written row by row to temp names
+    # and swapped in together on success, so a failed run never leaves a truncated
+    # file next to older ones.
+    names = ("trace.csv", "phi_ledger.csv", "trace.chain")
+    suffix = f".tmp-{uuid.uuid4().hex}"
+    tmps = [artifacts_dir / f"{name}{suffix}" for name in names]
+    try:
+        with open(tmps[0], "wb") as trace_f, open(tmps[1], "wb") as phi_f, open(tmps[2], "wb") as chain_f:
+            chain = HashChain(chain_f)
+            trace_offset = trace_f.write(_csv_line(TRACE_COLUMNS))
+            ledger_offset = phi_f.write(_csv_line(PHI_COLUMNS))
+            ledger_seen = 0
+            for raw in iter_steps(engine, G, candidates_per_step, pipelined=pipelined, lookahead=lookahead):
+                # Φ has just logged this step's eliminations; anything before them was
+                # already in the ledger when the run started (a reused engine)
+                first_own = len(ledger) - len(raw["eliminated"])
+                for rec in ledger[ledger_seen:first_own]:
+                    ledger_offset += phi_f.write(_csv_line(rec[c] for c in PHI_COLUMNS))
+                chain.update(raw, trace_offset, ledger_offset)
+                for rec in ledger[first_own:]:
+                    ledger_offset += phi_f.write(_csv_line(rec[c] for c in PHI_COLUMNS))
+                ledger_seen = len(ledger)
+                if not collect:
+                    del ledger[:]
+                    ledger_seen = 0
+
+                row = trace_row(raw)
+                emitted.append(raw["psi_choice"])
+                if collect:
+                    trace_rows.append(row)
+                    steps_raw.append(raw)
+                trace_offset += trace_f.write(_csv_line(row.values()))
+                if on_step is not None:
+                    on_step(raw)
+            for rec in ledger[ledger_seen:]:
+                phi_f.write(_csv_line(rec[c] for c in PHI_COLUMNS))
+        for name, tmp in zip(names, tmps):
+            os.replace(tmp, artifacts_dir / name)
+    finally:
+        for tmp in tmps:
+            if tmp.exists():
+                tmp.unlink()
+
+    if not collect:
+        return emitted, None, None, None, None, artifacts_dir
+    phi_df = pd.DataFrame(ledger)
+    trace_df = pd.DataFrame(trace_rows, columns=TRACE_COLUMNS)
+    if key:
+        store.put(key, artifacts_dir, {"steps_raw": steps_raw, "ledger": engine.Phi.ledger,
+                                        "G": snapshot_paths(G, engine.writes())})
 
     return emitted, trace_df, phi_df, steps_raw, [list(x) for x in candidates_per_step], artifacts_dir
 
 
+def _new_trace_table(title: str):
+    table = Table(title=title, show_lines=True)
+    table.add_column("Step", justify="right")
+    table.add_column("Candidates")
+    table.add_column("Survivors_after_T")
+    table.add_column("Ψ_choice")
+    table.add_column("Ψ_mode")
+    table.add_column("Entropy_H", justify="right")
+    return table
+
+
+def _color_trace_cells(step, cand_list: List[str], surv_list: List[str], choice: str, mode: str, H) -> Tuple[str, ...]:
+    surv_set = set(surv_list)
+    cands = []
+    for tok in cand_list:
+        if tok not in surv_set:
+            cands.append(f"[red strike]{tok}[/red strike]")
+        elif tok == choice:
+            cands.append(f"[bold white]{tok}[/bold white]")
+        else:
+            cands.append(f"[green]{tok}[/green]")
+
+    survs = []
+    for tok in surv_list:
+        if tok == choice:
+            survs.append(f"[bold white]{tok}[/bold white]")
+        else:
+            survs.append(f"[green]{tok}[/green]")
+
+    return (
+        str(step),
+        ", ".join(cands),
+        ", ".join(survs),
+        f"[bold white]{choice}[/bold white]",
+        mode,
+        f"{float(H):.1f}"
+    )
+
+
 def print_color(trace_df: pd.DataFrame, phi_df: pd.DataFrame):
     if not HAVE_RICH:
         print("\n=== TRACE ===")
@@ -294,42 +512,12 @@ def print_color(trace_df: pd.DataFrame, phi_df: pd.DataFrame):
         print(phi_df.to_string(index=False))
         return
 
-    table = Table(title="TRACE", show_lines=True)
-    table.add_column("Step", justify="right")
-    table.add_column("Candidates")
-    table.add_column("Survivors_after_T")
-    table.add_column("Ψ_choice")
-    table.add_column("Ψ_mode")
-    table.add_column("Entropy_H", justify="right")
-
+    table = _new_trace_table("TRACE")
     for _, row in trace_df.iterrows():
-        cands = []
         cand_list = [] if not row["Candidates"] else row["Candidates"].split(", ")
         surv_list = [] if not row["Survivors_after_T"] else row["Survivors_after_T"].split(", ")
-        choice = row["Ψ_choice"]
-        for tok in cand_list:
-            if tok not in surv_list:
-                cands.append(f"[red strike]{tok}[/red strike]")
-            elif tok == choice:
-                cands.append(f"[bold white]{tok}[/bold white]")
-            else:
-                cands.append(f"[green]{tok}[/green]")
-
-        survs = []
-        for tok in surv_list:
-            if tok == choice:
-                survs.append(f"[bold white]{tok}[/bold white]")
-            else:
-                survs.append(f"[green]{tok}[/green]")
-
-        table.add_row(
-            str(row["Step"]),
-            ", ".join(cands),
-            ", ".join(survs),
-            f"[bold white]{choice}[/bold white]",
-            row["Ψ_mode"],
-            f"{row['Entropy_H']:.1f}"
-        )
+        table.add_row(*_color_trace_cells(row["Step"], cand_list, surv_list,
+                                          row["Ψ_choice"], row["Ψ_mode"], row["Entropy_H"]))
     console.print(table)
 
     ledger_table = Table(title="Φ LEDGER", show_lines=True)
@@ -345,6 +533,186 @@ def print_color(trace_df: pd.DataFrame, phi_df: pd.DataFrame):
     console.print(ledger_table)
 
 
+# =============== Streaming renderer ===============
+def iter_trace_artifact(path, start: Optional[int] = None) -> Iterator[dict]:
+    """
+    Lazily reads a trace artifact (trace.csv, or a scenario directory containing one)
+    and yields raw step dicts, one line at a time. Given a 1-based start step and a
+    trace.chain next to the csv, seeks straight to that row; without the chain it
+    scans from the top and skips earlier rows.
+    """
+    path = Path(path)
+    if path.is_dir():
+        path = path / "trace.csv"
+    chain_path = path.with_name("trace.chain")
+    if start is not None and start > 1 and chain_path.exists():
+        with ChainFile(chain_path) as chain:
+            if start - 1 >= len(chain):
+                return
+            offset = chain.record(start - 1)[1]
+        with open(path, "rb") as raw_f:
+            raw_f.seek(offset)
+            f = io.TextIOWrapper(raw_f, encoding="utf-8", newline="")
+            for row in csv.reader(f):
+                yield _raw_from_trace_row(dict(zip(TRACE_COLUMNS, row)))
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            raw = _raw_from_trace_row(row)
+            if start is None or raw["step"] >= start:
+                yield raw
+
+
+def _raw_from_trace_row(row: dict) -> dict:
+    return {
+        "step": int(row["Step"]),
+        "candidates": [t for t in row["Candidates"].split(", ") if t],
+        "survivors_after_T": [t for t in row["Survivors_after_T"].split(", ") if t],
+        "psi_choice": row["Ψ_choice"],
+        "psi_mode": row["Ψ_mode"],
+        "entropy_H": float(row["Entropy_H"])
+    }
+
+
+def parse_step_range(spec: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Parses 'A:B', 'A:', ':B' or 'A' into an inclusive (start, end) step range.
+    Raises argparse.ArgumentTypeError on malformed input (used as an argparse type).
+    """
+    if not spec:
+        return None, None
+    try:
+        if ":" not in spec:
+            return int(spec), int(spec)
+        lo, hi = spec.split(":", 1)
+        return (int(lo) if lo else None), (int(hi) if hi else None)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid step range {spec!r} (expected A:B, A:, :B or A)")
+
+
+class TraceStream:
+    """
+    Renders raw steps as they arrive, in pages of `page_size` rows.
+    Nothing is buffered beyond one page, so time to first row does not depend
+    on trace length. Steps outside [start, end] and steps not mentioning `token`
+    (as candidate, survivor or choice) are skipped.
+    """
+    def __init__(self, start: Optional[int] = None, end: Optional[int] = None, token: Optional[str] = None,
+                 page_size: int = 50, color: bool = False, out=None):
+        self.start = start
+        self.end = end
+        self.token = token
+        self.page_size = max(1, page_size)
+        self.color = color and HAVE_RICH
+        self.out = out or sys.stdout
+        self.console = Console(file=self.out) if self.color else None
+        self.page: List[dict] = []
+        self.pages = 0
+        self.rows = 0
+
+    def past_end(self, raw: dict) -> bool:
+        return self.end is not None and raw["step"] > self.end
+
+    def accepts(self, raw: dict) -> bool:
+        if self.start is not None and raw["step"] < self.start:
+            return False
+        if self.past_end(raw):
+            return False
+        if self.token is not None and self.token not in raw["candidates"] and self.token != raw["psi_choice"]:
+            return False
+        return True
+
+    def feed(self, raw: dict):
+        if not self.accepts(raw):
+            return
+        self.rows += 1
+        if self.color:
+            self.page.append(raw)
+            if len(self.page) >= self.page_size:
+                self.flush()
+            return
+        if self.rows == 1:
+            print("\n=== TRACE ===", file=self.out)
+            print("Step | Candidates | Survivors_after_T | Ψ_choice | Ψ_mode | Entropy_H", file=self.out)
+        print(f"{raw['step']} | {', '.join(raw['candidates'])} | {', '.join(raw['survivors_after_T'])} | "
+              f"{raw['psi_choice']} | {raw['psi_mode']} | {float(raw['entropy_H']):.1f}", file=self.out)
+        if self.rows % self.page_size == 0:
+            self.pages += 1
+            self.out.flush()
+
+    def flush(self):
+        if self.color and self.page:
+            self.pages += 1
+            table = _new_trace_table(f"TRACE (page {self.pages})")
+            for raw in self.page:
+                table.add_row(*_color_trace_cells(raw["step"], raw["candidates"], raw["survivors_after_T"],
+                                                  raw["psi_choice"], raw["psi_mode"], raw["entropy_H"]))
+            self.console.print(table)
+            self.page = []
+        self.out.flush()
+
+    def render(self, steps: Iterable[dict]) -> int:
+        """Pulls steps from any iterable (engine output or artifacts); stops early past `end`."""
+        for raw in steps:
+            if self.past_end(raw):
+                break
+            self.feed(raw)
+        self.flush()
+        return self.rows
+
+
+# =============== Run comparison (hash chain) ===============
+def read_trace_window(artifacts_dir, chain: ChainFile, lo: int, hi: int) -> List[dict]:
+    """
+    Reads raw steps for 0-based indices [lo, hi), including their Φ eliminations, by
+    seeking straight to row lo of trace.csv and to its first row in phi_ledger.csv.
+    """
+    hi = min(hi, len(chain))
+    if lo >= hi:
+        return []
+    _, trace_offset, ledger_offset = chain.record(lo)
+    with open(Path(artifacts_dir) / "trace.csv", "rb") as f:
+        f.seek(trace_offset)
+        lines = [f.readline().decode("utf-8") for _ in range(hi - lo)]
+    steps = [_raw_from_trace_row(dict(zip(TRACE_COLUMNS, r))) for r in csv.reader(lines)]
+    by_step = {raw["step"]: raw for raw in steps}
+    for raw in steps:
+        raw["eliminated"] = []
+
+    with open(Path(artifacts_dir) / "phi_ledger.csv", "rb") as f:
+        f.seek(ledger_offset)
+        for line in iter(f.readline, b""):
+            step, token, reasons = next(csv.reader([line.decode("utf-8")]))
+            if int(step) > hi:
+                break
+            if int(step) in by_step:
+                by_step[int(step)]["eliminated"].append(
+                    {"token": token, "reasons": reasons.split(";") if reasons else []}
+                )
+    return steps
+
+
+def compare_runs(dir_a, dir_b, context: int = 2) -> Optional[dict]:
+    """
+    Compares two artifact dirs via their trace.chain files. Returns None when the runs
+    are identical; otherwise the first divergent step (1-based) and the surrounding
+    steps from each run, with their Φ eliminations. Only O(log n) chain records and
+    the window's trace and ledger rows are read.
+    """
+    with ChainFile(dir_a) as a, ChainFile(dir_b) as b:
+        idx = first_divergence(a, b)
+        if idx is None:
+            return None
+        lo, hi = max(0, idx - context), idx + context + 1
+        return {
+            "step": idx + 1,
+            "steps_a": len(a),
+            "steps_b": len(b),
+            "a": read_trace_window(dir_a, a, lo, hi),
+            "b": read_trace_window(dir_b, b, lo, hi),
+        }
+
+
 # =============== Verification ===============
 def verify_invariants(
     trace_df: pd.DataFrame,
@@ -404,8 +772,31 @@ def verify_invariants(
 
 
 # =============== CLI helpers ===============
+def make_trace_stream(args) -> TraceStream:
+    start, end = args.steps or (None, None)
+    return TraceStream(start=start, end=end, token=args.token, page_size=args.page_size, color=args.color)
+
+
 def run_single_scenario(name: str, run_fn, cand_fn, args) -> int:
-    emitted, trace_df, phi_df, steps_raw, cands, artifacts_dir = run_fn()
+    stream = make_trace_stream(args) if args.stream else None
+    try:
+        emitted, trace_df, phi_df, steps_raw, cands, artifacts_dir = run_fn(
+            on_step=stream.feed if stream else None,
+            pipelined=args.pipelined,
+            cache=args.cache,
+            lookahead=args.lookahead,
+            # Streaming keeps nothing in memory unless another flag needs the full trace
+            collect=not stream or args.json or args.print or args.verify
+        )
+    except InfeasibleSequence as e:
+        print(f"[Scenario: {name}] INFEASIBLE: {e}")
+        return 1
+    except (FileNotFoundError, sqlite3.DatabaseError) as e:
+        # e.g. COLLAPSE_KB_PATH naming a missing or non-index file
+        print(f"[Scenario: {name}] ERROR: {e}")
+        return 1
+    if stream:
+        stream.flush()
     print(f"[Scenario: {name}] GENERATED: {' '.join(emitted)}")
     print(f"Saved artifacts to {artifacts_dir}/trace.csv and {artifacts_dir}/phi_ledger.csv")
 
@@ -465,8 +856,59 @@ def main():
                         help="Write JSON artifacts alongside CSVs")
     parser.add_argument("--verify", action="store_true",
                         help="Verify invariants (H=0, survivors non-empty, Φ completeness, no Φ dupes)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream trace rows to stdout as the engine produces them, in pages. "
+                             "Unless --json/--print/--verify need them, trace and Φ ledger rows go "
+                             "straight to disk; only the emitted tokens stay in memory")
+    parser.add_argument("--render-artifacts", metavar="PATH",
+                        help="Stream a saved trace (trace.csv or artifacts/<scenario>/) without re-running")
+    parser.add_argument("--steps", metavar="A:B", type=parse_step_range,
+                        help="Only render steps in the inclusive range A:B (either side optional)")
+    parser.add_argument("--token",
+                        help="Only render steps where TOKEN is a candidate or the Ψ choice")
+    parser.add_argument("--page-size", type=int, default=50,
+                        help="Rows per rendered page (default: 50)")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="Prune steps that read no G field earlier steps write in worker threads "
+                             "(same output; only faster for I/O-bound kernels such as KB lookups)")
+    parser.add_argument("--lookahead", action="store_true",
+                        help="Forward-check: reject dead-end sequences early and steer Ψ around them")
+    parser.add_argument("--cache", action="store_true",
+                        help="Reuse results from .collapse_cache/ when scenario inputs and code are unchanged")
+    parser.add_argument("--compare", nargs=2, metavar=("DIR_A", "DIR_B"),
+                        help="Compare two artifact dirs by hash chain and report the first divergent step")
+    parser.add_argument("--context", type=int, default=2,
+                        help="Steps of context shown around a divergence (default: 2)")
     args = parser.parse_args()
 
+    if args.compare:
+        dir_a, dir_b = args.compare
+        try:
+            diff = compare_runs(dir_a, dir_b, context=args.context)
+        except FileNotFoundError as e:
+            parser.error(f"{e.filename} not found; re-run the scenario to write trace.csv and trace.chain")
+        if diff is None:
+            with ChainFile(dir_a) as a:
+                print(f"IDENTICAL: {len(a)} steps, head {a.head()}")
+            sys.exit(0)
+        print(f"DIVERGED at step {diff['step']} ({dir_a}: {diff['steps_a']} steps, {dir_b}: {diff['steps_b']} steps)")
+        for label, rows in ((dir_a, diff["a"]), (dir_b, diff["b"])):
+            print(f"\n--- {label}")
+            TraceStream(color=args.color).render(rows)
+            print("Φ eliminations:")
+            for raw in rows:
+                for e in raw["eliminated"]:
+                    print(f"  step {raw['step']}: {e['token']} ({';'.join(e['reasons'])})")
+        sys.exit(1)
+
+    if args.render_artifacts:
+        try:
+            start = args.steps[0] if args.steps else None
+            make_trace_stream(args).render(iter_trace_artifact(args.render_artifacts, start=start))
+        except FileNotFoundError as e:
+            parser.error(f"{e.filename} not found")
+        sys.exit(0)
+
     scenario_map = {
         "basic": (run_basic, candidates_basic),
         "coref": (run_coref, candidates_coref),
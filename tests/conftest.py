@@ -2,7 +2,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the project root (folder containing demo_runner.py) to sys.path
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep any artifact cache a test enables out of the repo root."""
+    monkeypatch.setenv("COLLAPSE_CACHE_DIR", str(tmp_path / ".collapse_cache"))
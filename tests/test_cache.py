@@ -0,0 +1,111 @@
+# tests/test_cache.py
+import demo_runner as demo
+from collapse_core.cache import ArtifactCache
+from collapse_core.T import KERNELS, T
+
+CALLS = []
+
+
+def k_counting(step, tok, G):
+    CALLS.append(step)
+    return (True, "count:any")
+
+
+def _engine():
+    return demo.CollapseEngine(T(kernels=KERNELS + [k_counting]), demo.Phi(), demo.Psi())
+
+
+def _run(**kw):
+    kw.setdefault("cache", True)
+    return demo.run_sequence(_engine(), demo.build_basic_graph(), demo.candidates_basic(),
+                             artifacts_subdir="basic", **kw)
+
+
+def test_cache_hit_skips_recompute(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    CALLS.clear()
+    emitted, trace_df, phi_df, steps_raw, _, artifacts_dir = _run()
+    n = len(CALLS)
+    assert n > 0
+    (artifacts_dir / "trace.csv").unlink()
+
+    h_emitted, h_trace_df, h_phi_df, h_steps_raw, _, _ = _run()
+    assert len(CALLS) == n
+    assert h_emitted == emitted and h_steps_raw == steps_raw
+    assert h_trace_df.equals(trace_df) and h_phi_df.equals(phi_df)
+    assert (artifacts_dir / "trace.csv").exists()
+
+    _run(cache=False)
+    assert len(CALLS) == 2 * n
+
+
+def test_cache_key_tracks_inputs():
+    cache = ArtifactCache()
+    G = demo.build_basic_graph()
+    base = cache.key(_engine(), G, demo.candidates_basic())
+    assert cache.key(_engine(), G, demo.candidates_basic()[:3]) != base
+    G["discourse"]["time"] = "present"
+    assert cache.key(_engine(), G, demo.candidates_basic()) != base
+
+
+def test_lru_eviction(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = ArtifactCache(tmp_path / "c", max_bytes=1)
+    artifacts_dir = _run(cache=False)[-1]
+    cache.put("old", artifacts_dir, {"steps_raw": []})
+    cache.put("new", artifacts_dir, {"steps_raw": []})
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+
+class PreferName(demo.Psi):
+    def __init__(self, pref):
+        self.pref = pref
+
+    def score(self, G, tok):
+        return 1.0 if tok == self.pref else 0.0
+
+
+def make_kernel(want):
+    def k_want(step, tok, G):
+        return (tok == want, "test:want")
+    return k_want
+
+
+def k_any(step, tok, G):
+    return (True, "test:any")
+
+
+def _pick(psi, kernel):
+    engine = demo.CollapseEngine(T(kernels=[kernel]), demo.Phi(), psi)
+    return demo.run_sequence(engine, {"discourse": {}, "cursor": {}}, [["Alice", "Bob", "Carol"]],
+                             artifacts_subdir="pick", cache=True)[0]
+
+
+def test_cache_key_covers_instance_and_closure_state(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert _pick(PreferName("Alice"), k_any) == ["Alice"]
+    assert _pick(PreferName("Bob"), k_any) == ["Bob"]
+    assert _pick(demo.Psi(), make_kernel("Carol")) == ["Carol"]
+    assert _pick(demo.Psi(), make_kernel("Bob")) == ["Bob"]
+
+
+def test_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    demo.run_basic()
+    assert not (tmp_path / ".collapse_cache").exists()
+
+
+def test_pipelined_run_hits_sequential_entry(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    CALLS.clear()
+    _run()
+    n = len(CALLS)
+    (tmp_path / "artifacts/basic/trace.chain").write_bytes(b"")
+    _run(pipelined=True)
+    assert len(CALLS) == n
+    with demo.ChainFile("artifacts/basic") as chain:
+        assert len(chain) == 12
+    assert sorted(p.name for p in (tmp_path / "artifacts/basic").iterdir()) == [
+        "phi_ledger.csv", "trace.chain", "trace.csv"
+    ]
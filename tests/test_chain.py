@@ -0,0 +1,84 @@
+# tests/test_chain.py
+import pytest
+import demo_runner as demo
+from collapse_core.chain import ChainFile, first_divergence
+from collapse_core.types import InfeasibleSequence
+
+
+class PreferCalled(demo.Psi):
+    def score(self, G, tok):
+        return 1.0 if tok == "called" else super().score(G, tok)
+
+
+def _run_basic(subdir, psi):
+    engine = demo.CollapseEngine(demo.T(), demo.Phi(), psi)
+    return demo.run_sequence(engine, demo.build_basic_graph(), demo.candidates_basic(), artifacts_subdir=subdir)
+
+
+def test_identical_runs_share_head(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _run_basic("a", demo.Psi())
+    _run_basic("b", demo.Psi())
+    assert demo.compare_runs("artifacts/a", "artifacts/b") is None
+    with ChainFile("artifacts/a") as a:
+        assert len(a) == 12
+
+
+def test_first_divergence_reports_region(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _run_basic("a", demo.Psi())
+    _run_basic("b", PreferCalled())
+    diff = demo.compare_runs("artifacts/a", "artifacts/b", context=1)
+    assert diff["step"] == 2
+    assert [r["step"] for r in diff["a"]] == [1, 2, 3]
+    assert diff["a"][1]["psi_choice"] == "emailed"
+    assert diff["b"][1]["psi_choice"] == "called"
+
+
+def test_prefix_run_diverges_at_its_end(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = demo.CollapseEngine(demo.T(), demo.Phi(), demo.Psi())
+    demo.run_sequence(engine, demo.build_basic_graph(), demo.candidates_basic()[:5], artifacts_subdir="short")
+    _run_basic("full", demo.Psi())
+    with ChainFile("artifacts/short") as a, ChainFile("artifacts/full") as b:
+        assert first_divergence(a, b) == 5
+
+
+def test_failed_run_keeps_previous_artifacts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _run_basic("s", demo.Psi())
+    _run_basic("t", demo.Psi())
+
+    def k_dead_at_step_2(step, tok, G):
+        return (step != 1, "test:dead_end")
+
+    engine = demo.CollapseEngine(demo.T(kernels=[k_dead_at_step_2]), demo.Phi(), demo.Psi())
+    with pytest.raises(InfeasibleSequence):
+        demo.run_sequence(engine, demo.build_basic_graph(), demo.candidates_basic(),
+                          artifacts_subdir="t")
+    assert sorted(p.name for p in (tmp_path / "artifacts" / "t").iterdir()) == [
+        "phi_ledger.csv", "trace.chain", "trace.csv"
+    ]
+    assert sum(1 for _ in demo.iter_trace_artifact("artifacts/t")) == 12
+    assert demo.compare_runs("artifacts/s", "artifacts/t") is None
+
+
+def test_divergence_in_eliminations_only(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def kernel(tag):
+        def k_not_b(step, tok, G):
+            return (tok != "b", tag)
+        return k_not_b
+
+    cands = [["a", "b"], ["a", "b"], ["a", "b"]]
+    for subdir, tag in (("a", "test:one"), ("b", "test:two")):
+        engine = demo.CollapseEngine(demo.T(kernels=[kernel(tag)]), demo.Phi(), demo.Psi())
+        demo.run_sequence(engine, demo.build_basic_graph(), cands, artifacts_subdir=subdir)
+
+    diff = demo.compare_runs("artifacts/a", "artifacts/b", context=1)
+    assert diff["step"] == 1
+    assert [r["psi_choice"] for r in diff["a"]] == [r["psi_choice"] for r in diff["b"]]
+    assert diff["a"][0]["eliminated"] == [{"token": "b", "reasons": ["test:one"]}]
+    assert diff["b"][0]["eliminated"] == [{"token": "b", "reasons": ["test:two"]}]
+    assert [len(r["eliminated"]) for r in diff["a"]] == [1, 1]
@@ -0,0 +1,99 @@
+# tests/test_kb.py
+import copy
+import pickle
+import sqlite3
+import pytest
+import demo_runner as demo
+from collapse_core.kb import FactStore, read_tsv
+from collapse_core.types import CandidateSet
+
+
+def _store(tmp_path, cache_size=4096):
+    return FactStore.build(tmp_path / "facts.sqlite", demo.KB_FACTS, cache_size=cache_size)
+
+
+def test_batched_lookup_and_lru(tmp_path):
+    store = _store(tmp_path)
+    capitals = store["capital_of"]
+    assert capitals.get_many(["France", "Spain", "Atlantis"]) == {
+        "France": "Paris", "Spain": "Madrid", "Atlantis": None
+    }
+    assert store.misses == 3 and store.hits == 0
+    assert capitals.get("France") == "Paris"
+    assert capitals.get("Atlantis", "?") == "?"  # negative results are cached too
+    assert store.misses == 3 and store.hits == 2
+
+
+def test_lru_is_bounded(tmp_path):
+    store = _store(tmp_path, cache_size=2)
+    store.get_many("capital_of", ["France", "Germany", "Spain"])
+    store.get("capital_of", "France")
+    assert store.misses == 4
+
+
+def test_store_is_shared_not_copied(tmp_path):
+    store = _store(tmp_path)
+    G = {"facts": store}
+    assert copy.deepcopy(G)["facts"] is store
+    clone = pickle.loads(pickle.dumps(store))
+    assert clone["capital_of"]["Germany"] == "Berlin"
+    assert clone.fingerprint == store.fingerprint
+
+
+def test_kb_kernel_prefetches_candidate_set(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    emitted, _, _, _, _, _ = demo.run_kb()
+    assert emitted == ["France", "."]
+    store = demo.open_kb()
+    G = {"facts": store, "subject_city": "Paris"}
+    demo.T(kernels=demo.kernels_kb()).prune(0, G, CandidateSet(demo.candidates_kb()[0]))
+    assert store.misses == 3 and store.hits == 3
+
+
+@pytest.mark.parametrize("content", [b"not a database at all" * 100, None])
+def test_open_kb_rebuilds_unusable_index(tmp_path, monkeypatch, content):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "artifacts" / "kb" / "facts.sqlite"
+    path.parent.mkdir(parents=True)
+    if content is None:  # a real SQLite file, but without the meta table
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE other (x)")
+        conn.commit()
+        conn.close()
+    else:
+        path.write_bytes(content)
+    with pytest.raises(sqlite3.DatabaseError):
+        FactStore(path)
+    assert demo.open_kb()["capital_of"]["Spain"] == "Madrid"
+    assert demo.run_kb()[0] == ["France", "."]
+
+
+def test_build_leaves_no_temp_files(tmp_path):
+    _store(tmp_path)
+    _store(tmp_path)
+    assert [p.name for p in tmp_path.iterdir()] == ["facts.sqlite"]
+
+
+def test_failed_build_leaves_no_temp_files(tmp_path):
+    def triples():
+        yield "capital_of", "France", "Paris"
+        raise RuntimeError("source went away")
+
+    with pytest.raises(RuntimeError):
+        FactStore.build(tmp_path / "facts.sqlite", triples())
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_tsv_rejects_malformed_lines(tmp_path):
+    tsv = tmp_path / "facts.tsv"
+    tsv.write_text("capital_of\tFrance\tParis\nbroken\n\ncapital_of\tSpain\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=r"2 malformed line\(s\).*at line\(s\) 2, 4"):
+        FactStore.build(tmp_path / "facts.sqlite", read_tsv(tsv))
+    assert [p.name for p in tmp_path.iterdir()] == ["facts.tsv"]
+
+
+def test_kb_path_must_exist(tmp_path, monkeypatch):
+    monkeypatch.setenv("COLLAPSE_KB_PATH", str(tmp_path / "missing.sqlite"))
+    with pytest.raises(FileNotFoundError, match="COLLAPSE_KB_PATH"):
+        demo.open_kb()
+    assert not (tmp_path / "missing.sqlite").exists()
@@ -0,0 +1,79 @@
+# tests/test_lookahead.py
+import pytest
+import demo_runner as demo
+from collapse_core.T import reads, T
+from collapse_core.types import InfeasibleSequence
+
+
+@reads(by_step={1: ("discourse.last_person_male",)})
+def k_pronoun(step, tok, G):
+    if step == 1:
+        return (tok == "him" and G["discourse"]["last_person_male"] == "Bob", "role:him_binds_to_Bob")
+    return (True, "role:any")
+
+
+@reads()
+def k_no_bang(step, tok, G):
+    return (tok != "!", "grammar:no_bang")
+
+
+def _run(candidates, **kw):
+    G = {"discourse": {"last_person_male": None}, "cursor": {}}
+    engine = demo.CollapseEngine(T(kernels=[k_pronoun, k_no_bang]), demo.Phi(), demo.Psi())
+    return demo.run_sequence(engine, G, candidates, artifacts_subdir="lookahead", **kw)
+
+
+def test_without_lookahead_dead_end_is_reported(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Ψ's tie-break picks "Alice", which leaves "him" unbound at step 2
+    with pytest.raises(InfeasibleSequence) as e:
+        _run([["Alice", "Bob"], ["him"]])
+    assert e.value.step == 2
+
+
+def test_lookahead_steers_away_from_dead_end(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    emitted, _, _, steps_raw, _, _ = _run([["Alice", "Bob"], ["him"]], lookahead=True)
+    assert emitted == ["Bob", "him"]
+    assert steps_raw[0]["psi_mode"] == "lookahead"
+
+
+def test_lookahead_rejects_static_dead_end_before_running(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    seen = []
+    with pytest.raises(InfeasibleSequence) as e:
+        _run([["Bob"], ["him"], ["!"]], lookahead=True, on_step=seen.append)
+    assert e.value.step == 3
+    assert e.value.reasons == {"!": ["grammar:no_bang"]}
+    assert seen == []
+
+
+@reads(by_step={2: ("discourse.last_person_male",)})
+def k_pronoun_later(step, tok, G):
+    if step == 2:
+        return (tok == "him" and G["discourse"]["last_person_male"] == "Bob", "role:him_binds_to_Bob")
+    return (True, "role:any")
+
+
+def test_lookahead_steers_around_dead_end_two_steps_away(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    G = {"discourse": {"last_person_male": None}, "cursor": {}}
+    engine = demo.CollapseEngine(T(kernels=[k_pronoun_later]), demo.Phi(), demo.Psi())
+    emitted, _, _, steps_raw, _, _ = demo.run_sequence(
+        engine, G, [["Alice", "Bob"], ["emailed"], ["him"]],
+        artifacts_subdir="lookahead", lookahead=True
+    )
+    assert emitted == ["Bob", "emailed", "him"]
+    assert steps_raw[0]["psi_mode"] == "lookahead"
+
+
+def test_distant_check_only_steers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # Step 2 picks "Bob" itself, so Ψ's first choice at step 1 must not be rejected
+    G = {"discourse": {"last_person_male": None}, "cursor": {}}
+    engine = demo.CollapseEngine(T(kernels=[k_pronoun_later]), demo.Phi(), demo.Psi())
+    emitted, _, _, _, _, _ = demo.run_sequence(
+        engine, G, [["Alice", "Carol"], ["Bob"], ["him"]],
+        artifacts_subdir="lookahead", lookahead=True
+    )
+    assert emitted == ["Alice", "Bob", "him"]
@@ -0,0 +1,55 @@
+# tests/test_pipeline.py
+import threading
+import pytest
+import demo_runner as demo
+from collapse_core.pipeline import PipelinedExecutor
+from collapse_core.T import T, reads
+
+
+@pytest.mark.parametrize("run_fn", [demo.run_basic, demo.run_coref, demo.run_tense, demo.run_kb])
+def test_pipelined_matches_sequential(run_fn, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    emitted, _, phi_df, steps_raw, _, _ = run_fn()
+    p_emitted, _, p_phi_df, p_steps_raw, _, _ = run_fn(pipelined=True)
+    assert p_emitted == emitted
+    assert p_steps_raw == steps_raw
+    assert p_phi_df.equals(phi_df)
+
+
+def test_dependency_analysis_basic():
+    engine = demo.CollapseEngine(T(), demo.Phi(), demo.Psi())
+    ex = PipelinedExecutor(engine)
+    writes = engine.writes()
+    dependent = [i for i in range(len(demo.candidates_basic())) if not ex.independent(i, writes)]
+    assert dependent == [5]  # pronoun binding reads discourse.last_person_male
+
+
+def test_undeclared_kernel_forces_sequential():
+    engine = demo.CollapseEngine(T(kernels=[lambda step, tok, G: (True, "any")]), demo.Phi(), demo.Psi())
+    ex = PipelinedExecutor(engine)
+    assert not ex.independent(0, engine.writes())
+
+
+def test_pipelined_overlaps_independent_prunes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    candidates = [["a", "b"]] * 40
+    # Steps 0 and 1 can only get past the barrier together: if their prunes were not
+    # in flight at the same time, wait() times out and BrokenBarrierError fails the run.
+    barrier = threading.Barrier(2, timeout=10)
+
+    @reads("facts")
+    def k_lookup(step, tok, G):
+        if step < 2:
+            barrier.wait()
+        return (True, "kb:any")
+
+    @reads("facts")
+    def k_plain(step, tok, G):
+        return (True, "kb:any")
+
+    def run(kernel, pipelined):
+        engine = demo.CollapseEngine(T(kernels=[kernel]), demo.Phi(), demo.Psi())
+        return demo.run_sequence(engine, {"facts": {}, "discourse": {}, "cursor": {}}, candidates,
+                                 artifacts_subdir="overlap", pipelined=pipelined)[3]
+
+    assert run(k_lookup, True) == run(k_plain, False)
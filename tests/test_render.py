@@ -0,0 +1,92 @@
+# tests/test_render.py
+import argparse
+import io
+import pytest
+import demo_runner as demo
+
+
+def test_stream_from_engine_matches_artifact():
+    live = io.StringIO()
+    stream = demo.TraceStream(start=3, end=6, page_size=2, out=live)
+    _, _, _, _, _, artifacts_dir = demo.run_basic(on_step=stream.feed)
+    stream.flush()
+
+    saved = io.StringIO()
+    rows = demo.TraceStream(start=3, end=6, page_size=2, out=saved).render(
+        demo.iter_trace_artifact(artifacts_dir)
+    )
+    assert rows == 4
+    assert live.getvalue() == saved.getvalue()
+    assert "\n3 | Bob, Alice | Bob | Bob | unique | 0.0\n" in live.getvalue()
+
+
+def test_stream_stops_past_end_and_filters_token():
+    def steps():
+        yield {"step": 1, "candidates": ["a", "b"], "survivors_after_T": ["a"],
+               "psi_choice": "a", "psi_mode": "unique", "entropy_H": 0.0}
+        yield {"step": 2, "candidates": ["c"], "survivors_after_T": ["c"],
+               "psi_choice": "c", "psi_mode": "unique", "entropy_H": 0.0}
+        yield {"step": 3, "candidates": ["b"], "survivors_after_T": ["b"],
+               "psi_choice": "b", "psi_mode": "unique", "entropy_H": 0.0}
+        yield {"step": 4, "candidates": ["b"], "survivors_after_T": ["b"],
+               "psi_choice": "b", "psi_mode": "unique", "entropy_H": 0.0}
+        raise AssertionError("renderer read past the requested range")
+
+    out = io.StringIO()
+    rows = demo.TraceStream(end=3, token="b", out=out).render(steps())
+    assert rows == 2
+    assert "\n2 |" not in out.getvalue()
+
+
+def test_parse_step_range():
+    assert demo.parse_step_range("3:8") == (3, 8)
+    assert demo.parse_step_range(":8") == (None, 8)
+    assert demo.parse_step_range("5") == (5, 5)
+    assert demo.parse_step_range(None) == (None, None)
+    with pytest.raises(argparse.ArgumentTypeError):
+        demo.parse_step_range("a:b")
+
+
+@pytest.mark.skipif(not demo.HAVE_RICH, reason="rich not installed")
+def test_color_pages_go_to_out():
+    out = io.StringIO()
+    stream = demo.TraceStream(page_size=1, color=True, out=out)
+    _, _, _, _, _, artifacts_dir = demo.run_basic()
+    stream.render(demo.iter_trace_artifact(artifacts_dir))
+    text = out.getvalue()
+    assert "TRACE (page 12)" in text
+    assert "approved" in text
+
+
+def test_stream_without_collect_keeps_no_trace():
+    seen = []
+    emitted, trace_df, phi_df, steps_raw, cands, artifacts_dir = demo.run_basic(
+        on_step=seen.append, collect=False
+    )
+    assert trace_df is None and phi_df is None and steps_raw is None and cands is None
+    assert [raw["psi_choice"] for raw in seen] == emitted
+    assert sum(1 for _ in demo.iter_trace_artifact(artifacts_dir)) == len(emitted) == 12
+
+
+def test_iter_trace_artifact_seeks_to_start(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _, _, _, steps_raw, _, artifacts_dir = demo.run_basic()
+    linear = [raw for raw in demo.iter_trace_artifact(artifacts_dir) if raw["step"] >= 5]
+    assert list(demo.iter_trace_artifact(artifacts_dir, start=5)) == linear
+    assert linear[0]["psi_choice"] == steps_raw[4]["psi_choice"]
+    assert list(demo.iter_trace_artifact(artifacts_dir, start=13)) == []
+
+    (artifacts_dir / "trace.chain").unlink()
+    assert list(demo.iter_trace_artifact(artifacts_dir, start=5)) == linear
+
+
+def test_stream_without_collect_streams_ledger(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = demo.CollapseEngine(demo.T(), demo.Phi(), demo.Psi())
+    demo.run_sequence(engine, demo.build_basic_graph(), demo.candidates_basic(), artifacts_subdir="a")
+    streamed = demo.CollapseEngine(demo.T(), demo.Phi(), demo.Psi())
+    demo.run_sequence(streamed, demo.build_basic_graph(), demo.candidates_basic(),
+                      artifacts_subdir="b", collect=False)
+    assert streamed.Phi.ledger == []
+    assert (tmp_path / "artifacts/a/phi_ledger.csv").read_bytes() == \
+        (tmp_path / "artifacts/b/phi_ledger.csv").read_bytes()